@@ -11,20 +11,79 @@ Usage:
 """
 
 import argparse
+import codecs
+import functools
+import json
 import os
 import re
+import string
 import sys
 import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 # Movie file extensions to consider
 MOVIE_EXTS = {
     ".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".mpg", ".mpeg", ".m4v", ".ts", ".webm", ".3gp", ".ogv"
 }
+# Same, for a single str.endswith() check on lowercased filenames
+_MOVIE_EXT_TUPLE = tuple(MOVIE_EXTS)
 
-# Allowed characters (we'll keep letters, numbers, spaces, dots, hyphens, underscores, parentheses)
-_SANITIZE_RE = re.compile(r"[^A-Za-z0-9\s\.\-\_\(\)\[\]]+")
+class MovieIndex(NamedTuple):
+    """
+    Movie files of one folder, as built by build_movie_index.
+    """
+    by_lower: Dict[str, List[Path]]  # lowercased stem -> movie files
+    by_norm: Dict[str, List[Path]]   # normalized stem (see normalize) -> movie files
+    names: Set[str]                  # lowercased names of every entry in the folder
+
+# How much of an .nfo to read before trying to find the title (titles sit near the top)
+NFO_HEAD_BYTES = 16 * 1024
+
+# Format of the --cache file; bump it whenever extract_title_from_nfo can return a different
+# title for an unchanged .nfo, so titles cached by older versions are not served anymore
+TITLE_CACHE_VERSION = 1
+
+# One pass over a title for sanitize_title. Alternatives, in order:
+# - common HTML entities (&amp; &quot; &#39;, also double-encoded); their decoded chars are not allowed anyway
+# - '-', re-spaced by _sanitize_piece
+# - runs of disallowed characters (we keep letters, numbers, spaces, dots, hyphens, underscores,
+#   parentheses, brackets); '&' is matched on its own so it can't swallow the start of an entity
+_SANITIZE_RE = re.compile(r"&(?:amp;)?(?:quot|#39);|&amp;|-|[^A-Za-z0-9\s\.\-\_\(\)\[\]&]+|&")
+_ASCII_ALNUM = frozenset(string.ascii_letters + string.digits)
+
+# Byte tables for normalize: lowercase ASCII letters, delete every other non-alnum ASCII byte
+_NORM_LOWER = bytes.maketrans(string.ascii_uppercase.encode(), string.ascii_lowercase.encode())
+_NORM_DELETE = bytes(b for b in range(128) if chr(b) not in _ASCII_ALNUM)
+
+# Patterns used while scanning NFOs and building filenames (compiled once, reused per file)
+_TITLE_TAG_RE = re.compile(r"<\s*title[^>]*>(.*?)<\s*/\s*title\s*>", re.I | re.S)
+_INNER_TAG_RE = re.compile(r"<[^>]+>")
+# "Title: ..." style metadata lines; applied with .match() to single stripped lines that
+# already passed the _META_LINE_PREFIXES check, so no anchors are needed
+_META_LINE_PREFIXES = ("title", "movie title", "moviename", "name")
+_META_LINE_RE = re.compile(r"(?:title|movie title|moviename|name)\s*[:=]\s*(.+)", re.I)
+
+# XML tags holding the title, most preferred first
+_XML_TITLE_TAGS = ("title", "movietitle", "originaltitle", "name")
+# How much XML text to feed the parser between checks for a finished <title>
+_XML_FEED_CHARS = 4096
+
+def _decode_nfo(raw: bytes, final: bool = True) -> str:
+    """
+    Decode NFO bytes as UTF-8 (BOM dropped), falling back to ISO-8859-1 if they aren't valid UTF-8.
+    With final=False, raw is a prefix of the file: a multi-byte character cut off at its end
+    is left out instead of counting as invalid UTF-8.
+    """
+    try:
+        if final:
+            return raw.decode("utf-8-sig")
+        return codecs.getincrementaldecoder("utf-8-sig")().decode(raw)
+    except UnicodeDecodeError:
+        # ISO-8859-1 maps every byte to a character, so this can't fail
+        return raw.decode("iso-8859-1")
 
 def extract_title_from_nfo(nfo_path: Path) -> Optional[str]:
     """
@@ -32,147 +91,390 @@ def extract_title_from_nfo(nfo_path: Path) -> Optional[str]:
     1) Parse as XML; search for <title>, <movietitle>, <originaltitle> tags (common).
     2) Regex search for <title>...</title> in raw text.
     3) Heuristic: look for a first non-empty line that looks like a title (as a fallback).
+    Only the first NFO_HEAD_BYTES are read at first; the rest of the file is read
+    only if no title turns up in that prefix.
     Returns None if nothing found.
     """
     try:
-        text = nfo_path.read_text(encoding="utf-8", errors="replace")
-    except Exception:
+        with nfo_path.open("rb") as f:
+            raw = f.read(NFO_HEAD_BYTES)
+            if len(raw) == NFO_HEAD_BYTES:
+                title = _title_from_text(_decode_nfo(raw, final=False), complete=False)
+                if title:
+                    return title
+                raw += f.read()
+    except OSError:
+        return None
+
+    return _title_from_text(_decode_nfo(raw), complete=True)
+
+def _title_from_xml(body: str, stop_early: bool) -> Optional[str]:
+    """
+    Return the text of the first non-root tag found for the most preferred of _XML_TITLE_TAGS,
+    else the text of the first <title> in any letter case (what the <title> regex would find).
+    Tags are matched on their local name, so a namespace doesn't hide them.
+    With stop_early (body is only a prefix of the file), the document is fed to a pull parser
+    in chunks and parsing stops as soon as the first non-root <title> closes, so the rest of a
+    large NFO (plot, cast, artwork) is never read; its text is returned, or None if it is empty
+    or no <title> closes within body, as then only the whole document can tell.
+    Otherwise the whole document must parse, so that malformed XML still falls back to the regex.
+    Raises ET.ParseError if body is not well-formed XML (with stop_early: within body).
+    """
+    if not stop_early:
+        return _title_from_tree(ET.fromstring(body), body)
+    parser = ET.XMLPullParser(events=("start", "end"))
+    first_title: Optional[ET.Element] = None
+    depth = 0
+    for i in range(0, len(body), _XML_FEED_CHARS):
+        parser.feed(body[i:i + _XML_FEED_CHARS])
+        for event, el in parser.read_events():
+            if event == "start":
+                # depth 0 is the root element; like root.find(".//title"), only descendants count
+                # (match on the local name: with a default namespace ET reports "{urn:...}title")
+                if depth and first_title is None and el.tag.rpartition("}")[2] == "title":
+                    first_title = el
+                depth += 1
+                continue
+            depth -= 1
+            if el is first_title:
+                return el.text.strip() if el.text and el.text.strip() else None
+            # drop finished top-level subtrees (plot, actors, ...) before the <title>
+            if depth == 1:
+                el.clear()
+    # body is cut off, so parser.close() would fail even on a well-formed file
+    return None
+
+def _title_from_tree(root: ET.Element, body: str) -> Optional[str]:
+    """
+    The lookups of _title_from_xml on a fully parsed document (body is its source text).
+    The find() calls run in C; "{*}" (any namespace) paths are matched in Python, so they
+    are only used when the document declares a namespace.
+    """
+    prefix = ".//{*}" if "xmlns" in body else ".//"
+    for tag in _XML_TITLE_TAGS:
+        el = root.find(prefix + tag)
+        if el is not None and el.text and el.text.strip():
+            return el.text.strip()
+    # any-case <title>, the root included; there is none unless "title" occurs in some case
+    if "title" in body.lower():
+        for el in root.iter():
+            if el.tag.rpartition("}")[2].lower() == "title":
+                return "".join(el.itertext()).strip() or None
+    return None
+
+def _title_from_text(text: str, complete: bool) -> Optional[str]:
+    """
+    Run the extraction strategies of extract_title_from_nfo over decoded NFO text.
+    When complete is False, text is only a prefix of the file and only <title> tags are
+    looked for: a metadata line or the first-line heuristic could still lose to a <title>
+    further down once the whole file is read.
+    """
+    # 1) Try XML parsing (only if the content starts like markup; plain-text NFOs skip the parser)
+    body = text.lstrip()
+    parsed_xml_ok = False
+    if body[:1] == "<":
         try:
-            text = nfo_path.read_text(encoding="iso-8859-1", errors="replace")
-        except Exception:
-            return None
+            # trailing whitespace is fine for the parser; only a leading one can break an <?xml?> header
+            title = _title_from_xml(body, stop_early=not complete)
+            if title:
+                return title
+            if not complete:
+                # the head parsed up to where it is cut off: only the whole file can tell
+                # (a <title> in a comment, a later <title> in another case, ...)
+                return None
+            parsed_xml_ok = True
+        except ET.ParseError:
+            # not strict XML - fall back to regex/heuristics
+            pass
 
-    # 1) Try XML parsing
-    try:
-        root = ET.fromstring(text.strip())
-        # look for common tags
-        for tag in ("title", "movietitle", "originaltitle", "name"):
-            el = root.find(".//" + tag)
-            if el is not None and el.text and el.text.strip():
-                return el.text.strip()
-    except ET.ParseError:
-        # not strict XML - fall back to regex/heuristics
-        pass
-
-    # 2) Regex search for <title>...</title> (case-insensitive)
-    m = re.search(r"(?i)<\s*title[^>]*>(.*?)<\s*/\s*title\s*>", text, re.DOTALL)
-    if m:
-        title = m.group(1).strip()
-        # remove any internal tags
-        title = re.sub(r"<[^>]+>", "", title).strip()
-        if title:
-            return title
+    # Cheap substring checks first: both patterns below need "title" (or "name") somewhere;
+    # the lowercased copy of the text is only made once one of them is going to run
+    lowered = None
+    has_title = False
+
+    # 2) Regex search for <title>...</title> (case-insensitive);
+    # not needed if the XML parse went through, it already looked for <title> in any case
+    if not parsed_xml_ok:
+        lowered = text.lower()
+        has_title = "title" in lowered
+        m = _TITLE_TAG_RE.search(text) if has_title else None
+        if m:
+            title = m.group(1).strip()
+            # remove any internal tags
+            title = _INNER_TAG_RE.sub("", title).strip()
+            if title:
+                return title
+
+    if not complete:
+        # a "Title:" line or the first-line heuristic could still lose to a <title> further down
+        return None
 
     # 3) Look for lines like "Title: ...", "MOVIE: ..." etc.
+    # 4) Fallback: first non-empty line that's not an obvious xml tag
+    # Both come from one pass over the lines; a metadata line anywhere still beats the fallback.
+    if lowered is None:
+        lowered = text.lower()
+        has_title = "title" in lowered
+    check_meta = has_title or "name" in lowered
+    fallback = None
     for line in text.splitlines():
         ln = line.strip()
         if not ln:
             continue
         # common metadata patterns
-        m2 = re.match(r"(?i)^(?:title|movie title|moviename|name)\s*[:=]\s*(.+)$", ln)
-        if m2:
-            t = m2.group(1).strip()
-            if t:
-                return t
+        if check_meta and ln[:16].lower().startswith(_META_LINE_PREFIXES):
+            m2 = _META_LINE_RE.match(ln)
+            if m2:
+                t = m2.group(1).strip()
+                if t:
+                    return t
+        if fallback is None and not ln.startswith("<"):  # "<..." looks like a tag -> skip
+            # remove surrounding quotes if any
+            candidate = ln.strip(' "\'')
+            if len(candidate) >= 2:
+                fallback = candidate
+                if not check_meta:
+                    break
 
-    # 4) Fallback: first non-empty line that's not an obvious xml tag
-    for line in text.splitlines():
-        ln = line.strip()
-        if not ln:
-            continue
-        if ln.startswith("<"):  # looks like a tag -> skip
-            continue
-        # remove surrounding quotes if any, and return
-        ln = ln.strip(' "\'')
-        if len(ln) >= 2:
-            return ln
+    return fallback
 
-    return None
+def _sanitize_piece(m: "re.Match[str]") -> str:
+    """
+    Replacement for one _SANITIZE_RE match: a '-' gets a space on each side that touches
+    a letter or digit; entities and disallowed characters are dropped.
+    """
+    if m.group() != "-":
+        return ""
+    s, i = m.string, m.start()
+    piece = " -" if i > 0 and s[i - 1] in _ASCII_ALNUM else "-"
+    if i + 1 < len(s) and s[i + 1] in _ASCII_ALNUM:
+        piece += " "
+    return piece
 
 def sanitize_title(title: str) -> str:
     """
     Sanitizes the title:
-    - Replace ':' with '-'
-    - Remove disallowed special characters (per _SANITIZE_RE)
+    - Replace ':' with '-' (and space '-' out from adjacent letters/digits)
+    - Drop common HTML entities and other disallowed special characters (per _SANITIZE_RE)
     - Collapse multiple spaces to one
     - Trim
     """
-    t = title.replace(":", "-")
-    # Insert space after '-' if followed by an alphabet character
-    t = re.sub(r"-(?=[A-Za-z0-9])", "- ", t)
-    # Insert space before '-' if preceded by an alphabet character
-    t = re.sub(r"([A-Za-z0-9])-", r"\1 -", t)
-    # Some NFOs may include HTML entities - decode common ones (basic)
-    t = t.replace("&amp;", "&").replace("&quot;", '"').replace("&#39;", "'")
-    # Remove other special characters
-    t = _SANITIZE_RE.sub("", t)
-    # Collapse whitespace
-    t = re.sub(r"\s+", " ", t).strip()
-    # Optionally, limit length (not strictly requested) - omitted; could add if desired
-    return t
-
-def find_movie_files_with_basename(dirpath: Path, base: str) -> List[Path]:
-    """
-    Return list of movie files in dirpath whose stem matches base.
+    t = _SANITIZE_RE.sub(_sanitize_piece, title.replace(":", "-"))
+    # Collapse whitespace and trim
+    return " ".join(t.split())
+
+@functools.lru_cache(maxsize=8192)
+def normalize(s: str) -> str:
+    """
+    Loose form of a filename stem for matching: ASCII letters/digits only, lowercased.
+    Cached, as the same stems (NFO basenames and their movie files, "sample", "trailer", ...)
+    come up again and again over a run.
+    """
+    # encoding to ASCII with "ignore" drops everything non-ASCII; the rest is one C-level translate
+    return s.encode("ascii", "ignore").translate(_NORM_LOWER, _NORM_DELETE).decode("ascii")
+
+def build_movie_index(dirpath: Path) -> MovieIndex:
+    """
+    Scan dirpath once and index its movie files by stem, so every NFO in the folder
+    can be matched without rescanning it. Movie files are listed in directory order,
+    keyed by:
+    1) the lowercased stem
+    2) the normalized stem (see normalize)
+    next to the lowercased names of all entries in dirpath (for unique_target).
+    """
+    by_lower: Dict[str, List[Path]] = {}
+    by_norm: Dict[str, List[Path]] = {}
+    names: Set[str] = set()
+    # scandir exposes the dirent type, so is_file() needs no extra stat() for regular files
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            name = entry.name
+            name_low = name.lower()
+            names.add(name_low)
+            # every extension starts with its only '.', so this matches exactly the
+            # names whose (lowercased) last suffix is in MOVIE_EXTS
+            if not name_low.endswith(_MOVIE_EXT_TUPLE) or not entry.is_file():
+                continue
+            dot = name.rfind(".")
+            if dot <= 0:  # ".mkv" alone is a hidden file without a stem
+                continue
+            stem = name[:dot]
+            p = Path(entry.path)
+            by_lower.setdefault(stem.lower(), []).append(p)
+            by_norm.setdefault(normalize(stem), []).append(p)
+    return MovieIndex(by_lower, by_norm, names)
+
+def match_movie_files(index: MovieIndex, base: str) -> List[Path]:
+    """
+    Return the movie files in an index from build_movie_index whose stem matches base.
     Matching is case-insensitive.
     Also handles files like "My.Movie.2020.mkv" vs nfo "My Movie 2020.nfo" by comparing stems ignoring punctuation.
     """
-    results = []
-    base_lower = base.lower()
     # two matching strategies:
     # 1) filename stem exactly equals base (case-insensitive)
     # 2) a looser normalized compare: remove non-alnum and compare
-    def normalize(s: str) -> str:
-        return re.sub(r"[^A-Za-z0-9]+", "", s).lower()
+    # (2) already covers (1) for ASCII names, so start from it to keep directory order
+    results = list(index.by_norm.get(normalize(base), ()))
+    for p in index.by_lower.get(base.lower(), ()):
+        if p not in results:
+            results.append(p)
+    return results
+
+def unique_target(dest: Path, existing_names: Set[str]) -> Path:
+    """
+    If dest is taken, append (1), (2), ... before suffix until unique.
+    existing_names holds the lowercased names already in dest's folder (see build_movie_index),
+    so no filesystem calls are made; the chosen name is added to it so later renames
+    into the same folder don't pick it again.
+    """
+    name = dest.name
+    if name.lower() in existing_names:
+        stem = dest.stem
+        suffix = dest.suffix
+        i = 1
+        while True:
+            name = f"{stem} ({i}){suffix}"
+            if name.lower() not in existing_names:
+                break
+            i += 1
+        dest = dest.parent / name
+    existing_names.add(name.lower())
+    return dest
+
+def _is_free_or_same_entry(target: Path, src: Path) -> bool:
+    """
+    True if nothing exists at target, or target is the very directory entry src
+    (a case-insensitive filesystem resolving a case-only rename to the same file).
+    Uses lstat, so a symlink at target - dangling or not - counts as a different entry.
+    """
+    try:
+        t = os.lstat(target)
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False
+    try:
+        s = os.lstat(src)
+    except OSError:
+        return False
+    return (t.st_ino, t.st_dev) == (s.st_ino, s.st_dev)
 
-    norm_base = normalize(base)
+def load_title_cache(cache_path: Path) -> Dict[str, list]:
+    """
+    Load the title cache written by save_title_cache: {nfo path: [st_mtime_ns, st_size, title]}.
+    A missing or unreadable cache file, or one written for another TITLE_CACHE_VERSION,
+    just means an empty cache.
+    """
+    try:
+        with cache_path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != TITLE_CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
 
-    for p in dirpath.iterdir():
-        if not p.is_file():
+def save_title_cache(cache_path: Path, cache: Dict[str, list]) -> None:
+    """
+    Write the title cache (via a temp file, so an interrupted run can't leave it half-written).
+    """
+    tmp = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"version": TITLE_CACHE_VERSION, "entries": cache}, f, ensure_ascii=False)
+        os.replace(tmp, cache_path)
+    except OSError as e:
+        print(f"[WARN] Could not write title cache {cache_path}: {e}")
+
+def prune_title_cache(cache: Dict[str, list], root: Path, recursive: bool, seen: Set[str]) -> None:
+    """
+    Drop the cache entries of NFOs in the folders this run scanned (root, plus its subfolders
+    if recursive) that it didn't find, so deleted or renamed NFOs don't pile up in the cache.
+    seen holds the cache keys (str paths) of the NFOs that were found.
+    """
+    root_s = str(root)
+    prefix = os.path.join(root_s, "")
+    for key in list(cache):
+        if key in seen:
             continue
-        if p.suffix.lower() in MOVIE_EXTS:
-            stem = p.stem
-            if stem.lower() == base_lower:
-                results.append(p)
-                continue
-            if normalize(stem) == norm_base:
-                results.append(p)
-                continue
-    return results
+        if key.startswith(prefix) if recursive else os.path.dirname(key) == root_s:
+            del cache[key]
 
-def unique_target(dest: Path) -> Path:
-    """
-    If dest exists, append (1), (2), ... before suffix until unique.
-    """
-    if not dest.exists():
-        return dest
-    parent = dest.parent
-    stem = dest.stem
-    suffix = dest.suffix
-    i = 1
-    while True:
-        candidate = parent / f"{stem} ({i}){suffix}"
-        if not candidate.exists():
-            return candidate
-        i += 1
-
-def main(root: Path, recursive: bool, dry_run: bool, do_yes: bool):
-    nfo_paths = []
-    if recursive:
-        for p in root.rglob("*.nfo"):
-            nfo_paths.append(p)
-    else:
-        for p in root.glob("*.nfo"):
-            nfo_paths.append(p)
-
-    if not nfo_paths:
-        print("No .nfo files found (in {}{}).".format(root, " (recursive)" if recursive else ""))
-        return
+def cached_title_from_nfo(nfo_path: Path, cache: Dict[str, list]) -> Optional[str]:
+    """
+    extract_title_from_nfo, memoized in cache by (path, mtime, size); an NFO that
+    changed since it was cached is parsed again. Misses (None) are cached too.
+    """
+    try:
+        st = nfo_path.stat()
+    except OSError:
+        return extract_title_from_nfo(nfo_path)
+    key = str(nfo_path)
+    hit = cache.get(key)
+    if (isinstance(hit, list) and len(hit) == 3 and hit[0] == st.st_mtime_ns and hit[1] == st.st_size
+            and (hit[2] is None or isinstance(hit[2], str))):
+        return hit[2]
+    title = extract_title_from_nfo(nfo_path)
+    cache[key] = [st.st_mtime_ns, st.st_size, title]
+    return title
+
+def _iter_nfos(root: Path, recursive: bool) -> Iterator[Path]:
+    """
+    Yield .nfo files under root, lazily.
+    Walks with os.scandir so entries are filtered on their dirent type and name;
+    a Path is only built for actual matches. Unreadable folders are skipped.
+    """
+    stack = [str(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                # normcase lowercases on Windows only, where glob("*.nfo") was case-insensitive too
+                elif os.path.normcase(entry.name).endswith(".nfo") and entry.is_file():
+                    yield Path(entry.path)
+
+def _titles_for(nfos: Iterable[Path], title_cache: Optional[Dict[str, list]]) -> Iterator[Tuple[Path, Optional[str]]]:
+    """
+    Yield (nfo, title) for each NFO, in order.
+    Titles are extracted on a thread pool, since reading NFOs is mostly I/O; only a bounded
+    number of NFOs is in flight at a time, so huge libraries aren't queued up all at once.
+    """
+    def extract(nfo: Path) -> Optional[str]:
+        if title_cache is None:
+            return extract_title_from_nfo(nfo)
+        return cached_title_from_nfo(nfo, title_cache)
+
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    pending: Deque[Tuple[Path, "Future[Optional[str]]"]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for nfo in nfos:
+            pending.append((nfo, ex.submit(extract, nfo)))
+            if len(pending) >= workers * 4:
+                done, fut = pending.popleft()
+                yield done, fut.result()
+        while pending:
+            done, fut = pending.popleft()
+            yield done, fut.result()
 
+def main(root: Path, recursive: bool, dry_run: bool, do_yes: bool, cache_path: Optional[Path] = None):
+    title_cache = load_title_cache(cache_path) if cache_path else None
+    found_nfo = False
+    seen_nfos: Set[str] = set()
     actions = []
-    for nfo in nfo_paths:
+    # one movie index per folder, shared by all the NFOs in it
+    movie_indexes: Dict[Path, MovieIndex] = {}
+    for nfo, title in _titles_for(_iter_nfos(root, recursive), title_cache):
+        found_nfo = True
+        seen_nfos.add(str(nfo))
         base = nfo.stem
-        title = extract_title_from_nfo(nfo)
         if not title:
             print(f"[WARN] Could not extract title from {nfo}")
             continue
@@ -182,19 +484,38 @@ def main(root: Path, recursive: bool, dry_run: bool, do_yes: bool):
             continue
 
         dirpath = nfo.parent
-        movie_files = find_movie_files_with_basename(dirpath, base)
+        index = movie_indexes.get(dirpath)
+        if index is None:
+            index = movie_indexes[dirpath] = build_movie_index(dirpath)
+        movie_files = match_movie_files(index, base)
         if not movie_files:
             print(f"[WARN] No movie files found matching basename '{base}' for NFO {nfo}")
             continue
 
         for mf in movie_files:
             new_name = f"{sanitized}{mf.suffix}"
-            target = dirpath / new_name
-            unique = unique_target(target)
-            if mf.resolve() == unique.resolve():
+            # mf comes from dirpath's index, so comparing names is enough (no resolve() syscalls);
+            # check before unique_target, which would otherwise count mf itself as a collision
+            if mf.name == new_name:
                 print(f"[SKIP] {mf} already has desired name.")
                 continue
-            actions.append((mf, unique, nfo, title, sanitized))
+            target = dirpath / new_name
+            existing_names = index.names
+            if new_name.lower() == mf.name.lower() and _is_free_or_same_entry(target, mf):
+                # case-only rename: mf's own name doesn't count as a collision, but the lowercased
+                # entry is shared with any other file differing only in case (case-sensitive FS),
+                # so only drop it when target is free or is mf itself (case-insensitive FS)
+                existing_names.discard(mf.name.lower())
+            unique = unique_target(target, existing_names)
+            actions.append((str(mf), str(unique), nfo, title, sanitized))
+
+    if cache_path:
+        prune_title_cache(title_cache, root, recursive, seen_nfos)
+        save_title_cache(cache_path, title_cache)
+
+    if not found_nfo:
+        print("No .nfo files found (in {}{}).".format(root, " (recursive)" if recursive else ""))
+        return
 
     if not actions:
         print("No renames to perform.")
@@ -202,7 +523,7 @@ def main(root: Path, recursive: bool, dry_run: bool, do_yes: bool):
 
     print(f"\nPlanned actions ({len(actions)}):")
     for src, dst, nfo, raw_title, sanitized in actions:
-        print(f"  {src.name}  ->  {dst.name}  (from NFO: {nfo.name} | raw title: {raw_title})")
+        print(f"  {os.path.basename(src)}  ->  {os.path.basename(dst)}  (from NFO: {nfo.name} | raw title: {raw_title})")
 
     if dry_run:
         print("\nDry run mode; no files were renamed. To perform renames rerun without --dry-run and add --yes to confirm.")
@@ -219,13 +540,11 @@ def main(root: Path, recursive: bool, dry_run: bool, do_yes: bool):
             print("Aborted by user.")
             return
 
-    # Perform renames
+    # Perform renames (src/dst are already strings, so call os.rename directly)
     for src, dst, nfo, raw_title, sanitized in actions:
         try:
-            dst_parent = dst.parent
-            # ensure the parent exists (it does)
-            src.rename(dst)
-            print(f"[OK] Renamed: {src.name} -> {dst.name}")
+            os.rename(src, dst)
+            print(f"[OK] Renamed: {os.path.basename(src)} -> {os.path.basename(dst)}")
         except Exception as e:
             print(f"[ERROR] Failed to rename {src} -> {dst}: {e}")
 
@@ -235,6 +554,7 @@ if __name__ == "__main__":
     ap.add_argument("--recursive", "-r", action="store_true", help="Scan folders recursively")
     ap.add_argument("--dry-run", "-n", action="store_true", help="Show what would be done but don't rename files")
     ap.add_argument("--yes", "-y", action="store_true", help="Don't prompt, just perform renames")
+    ap.add_argument("--cache", metavar="PATH", help="Remember titles extracted from .nfo files in this JSON file; unchanged .nfo files are not parsed again, and entries for .nfo files no longer found in the scanned folders are dropped")
     args = ap.parse_args()
 
     root = Path(args.path).expanduser().resolve()
@@ -242,4 +562,5 @@ if __name__ == "__main__":
         print("Path does not exist or is not a directory:", root)
         sys.exit(1)
 
-    main(root, args.recursive, args.dry_run, args.yes)
+    cache_path = Path(args.cache).expanduser() if args.cache else None
+    main(root, args.recursive, args.dry_run, args.yes, cache_path)